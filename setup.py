@@ -15,6 +15,9 @@ setup(
             'pytest-mock>=3.5.0',
             'pytest-cov>=2.12.0',
         ],
+        'fast': [
+            'uvloop>=0.17; sys_platform != "win32"',
+        ],
     },
     entry_points={
         'console_scripts': [
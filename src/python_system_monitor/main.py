@@ -19,7 +19,7 @@ Components:
 import curses
 import asyncio
 import signal
-import time
+import sys
 from python_system_monitor.monitors.system_info import SystemInfo
 from python_system_monitor.monitors.cpu_monitor import CPUMonitor
 from python_system_monitor.monitors.memory_monitor import MemoryMonitor
@@ -27,96 +27,152 @@ from python_system_monitor.monitors.network_monitor import NetworkMonitor
 from python_system_monitor.monitors.process_monitor import ProcessMonitor
 from python_system_monitor.ui.ui_handler import UIHandler
 
-async def monitor_cpu(cpu_monitor, ui, y, x, width):
+async def monitor_cpu(cpu_monitor, ui):
     """CPU monitoring with minimal latency"""
     while True:
         stats = cpu_monitor.get_detailed_stats()
-        ui.update_cpu_section(y, x, width, stats)
+        ui.post_update('cpu', stats)
         await asyncio.sleep(0.05) 
 
-async def monitor_memory(memory_monitor, ui, y, x, width):
+async def monitor_memory(memory_monitor, ui):
     """Memory monitoring with higher frequency"""
     while True:
         try:
-            mem = memory_monitor.get_memory_percentage()
-            swap = memory_monitor.get_swap_percentage()
-            ui.update_memory_section(y, x, width, mem, swap)
+            mem, swap = memory_monitor.get_both()
+            ui.post_update('memory', mem, swap)
             await asyncio.sleep(0.1) 
         except Exception as e:
             await asyncio.sleep(0.1)
 
-async def monitor_system_info(system_info, ui, y, x, width):
+async def monitor_system_info(system_info, ui):
     """System info with staggered updates"""
     while True:
         try:
             data = await system_info.get_system_info()
-            ui.update_system_info(y, x, width, data)
+            ui.post_update('system', data)
             await asyncio.sleep(10) 
         except Exception as e:
             await asyncio.sleep(5)
 
-async def monitor_network(network_monitor, ui, y, x, width):
+async def monitor_network(network_monitor, ui):
     """Network monitoring with minimal delay"""
     while True:
         try:
             data = network_monitor.get_bandwidth_usage()
-            ui.update_network_section(y, x, width, data)
+            ui.post_update('network', data)
             await asyncio.sleep(0.05) 
         except Exception as e:
             await asyncio.sleep(0.05)
 
-async def monitor_processes(process_monitor, ui, y, x, width):
+async def monitor_processes(process_monitor, ui):
     """Process monitoring with higher frequency"""
     while True:
         try:
             processes = process_monitor.get_running_processes()
-            ui.update_process_section(y, x, width, processes, ui.selected_process)
+            ui.post_update('processes', processes)
             await asyncio.sleep(0.2)
         except Exception as e:
             await asyncio.sleep(0.1)
 
 async def handle_process_control(process_monitor, ui):
-    """Responsive process control"""
-    while True:
-        try:
+    """Responsive process control, woken only when input is pending"""
+    loop = asyncio.get_running_loop()
+    key_ready = asyncio.Event()
+    stdin_fd = sys.stdin.fileno()
+    loop.add_reader(stdin_fd, key_ready.set)
+    try:
+        while True:
+            await key_ready.wait()
+            key_ready.clear()
+            # Drain everything curses has buffered (escape sequences etc.)
             key = ui.stdscr.getch()
-            if key != -1:
-                action = ui.handle_input(key)
-                if action == 'kill':
-                    processes = process_monitor.get_running_processes()
-                    if processes and 0 <= ui.selected_process < len(processes):
-                        pid = processes[ui.selected_process]['pid']
-                        process_monitor.kill_process(pid)
-                elif action == 'refresh':
-                    ui.stdscr.clear()
-                    ui.stdscr.refresh()
-            await asyncio.sleep(0.016)
-        except Exception as e:
-            await asyncio.sleep(0.016)
+            while key != -1:
+                try:
+                    action = ui.handle_input(key)
+                    if action == 'kill':
+                        processes = process_monitor.get_running_processes()
+                        if processes and 0 <= ui.selected_process < len(processes):
+                            pid = processes[ui.selected_process]['pid']
+                            process_monitor.kill_process(pid)
+                    elif action == 'refresh':
+                        ui.clear_screen()
+                        apply_layout(ui, ui.stdscr)
+                    ui.mark_dirty('processes')
+                except Exception as e:
+                    pass
+                key = ui.stdscr.getch()
+    finally:
+        loop.remove_reader(stdin_fd)
 
-async def ui_refresher(ui):
-    """Higher frequency UI refresh"""
-    while True:
-        await asyncio.sleep(0.016)
-        ui.stdscr.refresh()
+async def renderer(ui, fps=60):
+    """Single frame scheduler: draws queued section updates at most fps times a second.
+
+    Sleeps until the UI has something to draw, so an idle screen costs no wakeups.
+    """
+    frame_time = 1 / fps
+    frame_ready = asyncio.Event()
+    ui.set_wakeup(frame_ready.set)
+    try:
+        while True:
+            await frame_ready.wait()
+            frame_ready.clear()
+            try:
+                ui.render_frame()
+            except curses.error:
+                pass
+            # Updates arriving meanwhile are batched into the next frame
+            await asyncio.sleep(frame_time)
+    finally:
+        ui.set_wakeup(None)
+
+def apply_layout(ui, stdscr):
+    """Draw the frame for ui.last_layout and repaint every section into it"""
+    h, w = ui.last_height, ui.last_width
+    ui.too_small = h < ui.layout['min_height'] or w < ui.layout['min_width']
+    if ui.too_small:
+        ui.draw_size_warning(h, w)
+        ui.request_flush()
+        return
+    for section, dims in zip(ui.last_layout._fields, ui.last_layout):
+        ui.draw_box(dims.y, dims.x, dims.h, dims.w, section.upper())
+    ui.draw_instructions()
+    ui.mark_all_dirty()
+    ui.request_flush()
 
 async def handle_resize(ui, stdscr):
-    """Enhanced resize handler with debouncing and smooth transitions"""
+    """Resize watcher woken by SIGWINCH; monitors keep running and are redrawn in place.
+
+    Keys are read through add_reader, so no polling getch is around to turn
+    SIGWINCH into KEY_RESIZE; the signal is watched here instead.
+    """
+    loop = asyncio.get_running_loop()
+    resized = asyncio.Event()
     resize_timeout = 0.1
-    last_resize = 0
-    
-    while True:
-        try:
-            current_time = time.time()
-            if current_time - last_resize > resize_timeout:
-                new_layout = ui.handle_resize()
-                if new_layout:
-                    last_resize = current_time
-                    return new_layout
-            await asyncio.sleep(0.05)
-        except curses.error:
-            pass
-        
+    try:
+        loop.add_signal_handler(signal.SIGWINCH, resized.set)
+        poll_interval = None
+    except (AttributeError, NotImplementedError, RuntimeError):
+        # No SIGWINCH (e.g. Windows): poll the size instead
+        poll_interval = 0.05
+
+    try:
+        while True:
+            if poll_interval is None:
+                await resized.wait()
+                # Debounce: let a drag-resize settle, then handle it once
+                await asyncio.sleep(resize_timeout)
+                resized.clear()
+            else:
+                await asyncio.sleep(poll_interval)
+            try:
+                if ui.handle_resize():
+                    apply_layout(ui, stdscr)
+            except curses.error:
+                pass
+    finally:
+        if poll_interval is None:
+            loop.remove_signal_handler(signal.SIGWINCH)
+
 async def main(stdscr):
     """Enhanced main function with smooth updates"""
     # Initialize curses
@@ -128,11 +184,6 @@ async def main(stdscr):
     
     ui = UIHandler(stdscr)
     
-    # Initial layout calculation
-    h, w = stdscr.getmaxyx()
-    layout = ui.get_layout(h, w)
-    ui.last_layout = layout 
-    
     # Monitor instances and their corresponding monitoring functions
     monitors = {
         'system': (SystemInfo(), monitor_system_info),
@@ -142,58 +193,78 @@ async def main(stdscr):
         'processes': (ProcessMonitor(), monitor_processes)
     }
 
-    while True:
-        try:
-            h, w = stdscr.getmaxyx()
-            if h < ui.layout['min_height'] or w < ui.layout['min_width']:
-                ui.draw_size_warning(h, w)
-                ui.refresh()
-                await asyncio.sleep(0.5)
-                continue
-
-            # Clear screen and draw layout
-            stdscr.clear()
-            layout = ui.get_layout(h, w)
-            
-            # Draw boxes first
-            for section, dims in layout.items():
-                ui.draw_box(dims['y'], dims['x'], dims['h'], dims['w'], section.upper())
-            
-            # Draw instructions (add this before creating tasks)
-            ui.draw_instructions()
-            
-            # Create monitoring tasks
-            tasks = []
-            for section, dims in layout.items():
-                if section in monitors:
-                    monitor_instance, monitor_func = monitors[section]
-                    task = asyncio.create_task(monitor_func(
-                        monitor_instance, ui, 
-                        dims['y']+1, dims['x']+1, 
-                        dims['w']-2
-                    ))
-                    tasks.append(task)
-
-            # Add control tasks
-            tasks.extend([
-                asyncio.create_task(handle_process_control(monitors['processes'][0], ui)),
-                asyncio.create_task(ui_refresher(ui))
-            ])
-
-            await asyncio.gather(*tasks)
-
-        except KeyboardInterrupt:
-            break
-        except curses.error:
-            stdscr.refresh()
-            await asyncio.sleep(0.1)
+    try:
+        # Tasks are long-lived: a resize only changes ui.last_layout, and they are
+        # recreated only when recovering from an error
+        while True:
+            try:
+                # Clear screen and draw layout
+                ui.clear_screen()
+                h, w = stdscr.getmaxyx()
+                ui.last_height, ui.last_width = h, w
+                ui.last_layout = ui.get_layout(h, w)
+                apply_layout(ui, stdscr)
+
+                tasks = [
+                    asyncio.create_task(monitor_func(monitor_instance, ui))
+                    for monitor_instance, monitor_func in monitors.values()
+                ]
+                tasks.extend([
+                    asyncio.create_task(handle_resize(ui, stdscr)),
+                    asyncio.create_task(handle_process_control(monitors['processes'][0], ui)),
+                    asyncio.create_task(renderer(ui))
+                ])
+
+                # Stop at the first failure and tear the rest down, rather than
+                # leaving orphaned tasks behind when the loop restarts
+                done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+                for task in pending:
+                    task.cancel()
+                if pending:
+                    await asyncio.wait(pending)
+                for task in done:
+                    task.result()
+
+            except KeyboardInterrupt:
+                break
+            except curses.error:
+                # The next pass clears and repaints everything
+                await asyncio.sleep(0.1)
+    finally:
+        # Release the /proc handles held by the CPU and memory monitors
+        for monitor_instance, _ in monitors.values():
+            close = getattr(monitor_instance, 'close', None)
+            if close:
+                close()
+
+def event_loop_factory():
+    """uvloop's libuv-based loop factory when it is available, else None"""
+    if sys.platform == 'win32':
+        return None
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+def run_main(stdscr):
+    """Run main() on uvloop when available, otherwise on asyncio's default loop"""
+    loop_factory = event_loop_factory()
+    if loop_factory is None:
+        return asyncio.run(main(stdscr))
+    if hasattr(asyncio, 'Runner'):
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            return runner.run(main(stdscr))
+    # Python < 3.11 has no Runner; uvloop.install() is fine there
+    import uvloop
+    uvloop.install()
+    return asyncio.run(main(stdscr))
 
 def run():
     """Entry point for curses wrapper"""
-    curses.wrapper(lambda stdscr: asyncio.run(main(stdscr)))
+    curses.wrapper(run_main)
 
 if __name__ == "__main__":
-    import sys
     import os
     # Add the project root directory to Python path
     project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
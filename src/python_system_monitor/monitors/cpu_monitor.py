@@ -19,11 +19,15 @@ import platform
 import os
 import time
 
+PROC_STAT = '/proc/stat'
+
 class CPUMonitor:
     """Monitors CPU activity and provides usage statistics.
 
     Args:
         bars (int): Number of characters to use in the visual progress bars
+        stat_path (str): Kernel CPU counters file read directly for usage;
+            None (or an unreadable path) falls back to psutil
 
     Features:
     - Per-core and overall CPU usage tracking
@@ -32,14 +36,96 @@ class CPUMonitor:
     - Visual representation of CPU load
     """
 
-    def __init__(self, bars=50):
+    def __init__(self, bars=50, stat_path=PROC_STAT):
         self.temp_sensors = self._init_temp_sensors()
         self.prev_cpu_times = psutil.cpu_times()
         self.bars = bars
+        self._bar_cache = tuple(('#' * i).ljust(bars, '-') for i in range(bars + 1))
+        self._bar_scale = bars / 100.0
+        self._stat_file = self._open_stat(stat_path)
+        self._prev_stat = None
+        self._sample_usage()
+        self.last_check_time = time.monotonic()
+        self.update_threshold = 0.05 
+        # Slow-moving readings are refreshed on their own, longer intervals
+        self._cache = {'freq': (None, None), 'load': (None, None), 'temp': (None, None)}
+        self.cache_ttls = {'freq': 0.5, 'load': 5.0, 'temp': 1.0}
+
+    def _cached(self, key, fn):
+        """Return a cached reading, calling fn again once its TTL expires"""
+        last_time, value = self._cache[key]
+        now = time.monotonic()
+        if last_time is None or now - last_time >= self.cache_ttls[key]:
+            value = fn()
+            self._cache[key] = (now, value)
+        return value
+
+    def close(self):
+        """Release the /proc/stat handle; later samples use psutil"""
+        if self._stat_file is not None:
+            self._stat_file.close()
+            self._stat_file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _open_stat(self, stat_path):
+        if not stat_path:
+            return None
+        try:
+            return open(stat_path, 'rb')
+        except OSError:
+            return None
+
+    def _read_stat(self):
+        """Read (busy, total) jiffies for the aggregate CPU and each core"""
+        self._stat_file.seek(0)
+        samples = []
+        for line in self._stat_file.read().splitlines():
+            if not line.startswith(b'cpu'):
+                break
+            # Guest time is already included in user/nice
+            user, nice, system, idle, iowait, irq, softirq, steal = map(int, line.split()[1:9])
+            busy = user + nice + system + irq + softirq + steal
+            samples.append((busy, busy + idle + iowait))
+        return samples
+
+    def _sample_usage(self):
+        """Refresh overall and per-core usage percentages"""
+        if self._stat_file is not None:
+            try:
+                current = self._read_stat()
+                if current:
+                    self._apply_stat(current)
+                    return
+            except (OSError, ValueError):
+                pass
+            # Unreadable or unexpected format: use psutil from now on
+            self.close()
         self.last_cpu_percent = psutil.cpu_percent(interval=None)
         self.last_per_cpu_percent = psutil.cpu_percent(interval=None, percpu=True)
-        self.last_check_time = time.time()
-        self.update_threshold = 0.05 
+
+    def _apply_stat(self, current):
+        """Turn a /proc/stat sample into percentages against the previous one"""
+        previous = self._prev_stat
+        if previous is None or len(previous) != len(current):
+            # First sample (or CPUs hot-plugged): measure from boot
+            previous = [(0, 0)] * len(current)
+        percents = []
+        for (busy, total), (prev_busy, prev_total) in zip(current, previous):
+            delta_total = total - prev_total
+            if delta_total <= 0:
+                percents.append(0.0)
+            else:
+                percent = (busy - prev_busy) / delta_total * 100
+                percents.append(round(min(100.0, max(0.0, percent)), 1))
+        self._prev_stat = current
+        self.last_cpu_percent = percents[0]
+        self.last_per_cpu_percent = percents[1:]
+
     def _init_temp_sensors(self):
         if platform.system() == 'Linux':
             sensors = {}
@@ -54,20 +140,19 @@ class CPUMonitor:
         return None
 
     def get_detailed_stats(self):
-        current_time = time.time()
+        current_time = time.monotonic()
         if current_time - self.last_check_time >= self.update_threshold: 
-            self.last_cpu_percent = psutil.cpu_percent(interval=None)
-            self.last_per_cpu_percent = psutil.cpu_percent(interval=None, percpu=True)
+            self._sample_usage()
             self.last_check_time = current_time
 
-        cpu_freq = psutil.cpu_freq()
+        cpu_freq = self._cached('freq', psutil.cpu_freq)
         stats = {
             'usage': self.last_cpu_percent,
             'freq_current': cpu_freq.current if cpu_freq else 0,
             'freq_max': cpu_freq.max if cpu_freq else 0,
             'cores': self.last_per_cpu_percent,
-            'temps': self._get_temps(),
-            'load_avg': psutil.getloadavg()
+            'temps': self._cached('temp', self._get_temps),
+            'load_avg': self._cached('load', psutil.getloadavg)
         }
         return stats
 
@@ -80,14 +165,16 @@ class CPUMonitor:
         return self._format_usage(self.last_cpu_percent)
 
     def get_cpu_cores_usage(self):
-        return [self._format_core_usage(idx, core) for idx, core in enumerate(self.last_per_cpu_percent)]
+        format_core = self._format_core_usage
+        return [format_core(idx, core) for idx, core in enumerate(self.last_per_cpu_percent)]
+
+    def _bar(self, percent):
+        """Look up the precomputed bar string for a usage percentage"""
+        idx = min(self.bars, max(0, int(percent * self._bar_scale)))
+        return self._bar_cache[idx]
 
     def _format_usage(self, cpu):
-        cpu_percent = cpu / 100.0
-        cpu_visual = '#' * int(cpu_percent * self.bars) + '-' * (self.bars - int(cpu_percent * self.bars))
-        return f"CPU: [{cpu_visual}] {cpu:.2f}%"
+        return f"CPU: [{self._bar(cpu)}] {cpu:.2f}%"
 
     def _format_core_usage(self, core_idx, core):
-        core_percent = core / 100.0
-        core_visual = '#' * int(core_percent * self.bars) + '-' * (self.bars - int(core_percent * self.bars))
-        return f"Core {core_idx}: [{core_visual}] {core:.2f}%"
\ No newline at end of file
+        return f"Core {core_idx}: [{self._bar(core)}] {core:.2f}%"
\ No newline at end of file
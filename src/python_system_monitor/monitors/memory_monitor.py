@@ -15,19 +15,31 @@ Example usage:
 """
 
 import psutil
+import time
+
+PROC_MEMINFO = '/proc/meminfo'
 
 class MemoryMonitor:
     """Tracks and visualizes system memory usage.
 
     Args:
         bars (int): Number of characters to use in the visual progress bar
+        meminfo_path (str): Kernel memory counters file read directly by
+            get_both; None (or an unreadable path) falls back to psutil
 
     The monitor provides both numerical percentages and visual representations
     of memory usage for both RAM and swap space.
     """
 
-    def __init__(self, bars=50):
+    def __init__(self, bars=50, cache_ttl=0.05, meminfo_path=PROC_MEMINFO):
         self.bars = bars
+        # Kept open: /proc files are regenerated on each read from offset 0
+        self._meminfo_file = self._open_meminfo(meminfo_path)
+        self.cache_ttl = cache_ttl
+        self._last_sample = None
+        self._last_sample_time = 0.0
+        self._bar_cache = tuple(('#' * i).ljust(bars, '-') for i in range(bars + 1))
+        self._bar_scale = bars / 100.0
 
     def get_memory_percentage(self) -> float:
         """Returns current RAM usage as percentage."""
@@ -37,6 +49,60 @@ class MemoryMonitor:
         """Returns current swap usage as percentage."""
         return psutil.swap_memory().percent
 
+    def get_both(self) -> tuple:
+        """Returns (RAM, swap) usage percentages, sampled at most once per cache_ttl."""
+        now = time.monotonic()
+        if self._last_sample is None or now - self._last_sample_time >= self.cache_ttl:
+            self._last_sample = self._sample_both()
+            self._last_sample_time = now
+        return self._last_sample
+
+    def close(self):
+        """Release the /proc/meminfo handle; later samples use psutil"""
+        if self._meminfo_file is not None:
+            self._meminfo_file.close()
+            self._meminfo_file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _open_meminfo(self, meminfo_path):
+        if not meminfo_path:
+            return None
+        try:
+            return open(meminfo_path, 'rb')
+        except OSError:
+            return None
+
+    def _sample_both(self):
+        if self._meminfo_file is not None:
+            try:
+                return self._read_meminfo()
+            except (OSError, KeyError, ValueError, IndexError):
+                # Unexpected format: use psutil from now on
+                self.close()
+        return (self.get_memory_percentage(), self.get_swap_percentage())
+
+    def _read_meminfo(self):
+        """Parse (RAM, swap) usage percentages from one read of /proc/meminfo"""
+        self._meminfo_file.seek(0)
+        data = self._meminfo_file.read()
+        fields = {}
+        for line in data.splitlines():
+            key, _, value = line.partition(b':')
+            fields[key] = value.split(None, 1)[0]
+        mem_total = int(fields[b'MemTotal'])
+        mem_used = mem_total - int(fields[b'MemAvailable'])
+        swap_total = int(fields[b'SwapTotal'])
+        swap_used = swap_total - int(fields[b'SwapFree'])
+        # Same definitions and rounding as psutil's virtual_memory/swap_memory
+        ram = round(mem_used / mem_total * 100, 1) if mem_total else 0.0
+        swap = round(swap_used / swap_total * 100, 1) if swap_total else 0.0
+        return (ram, swap)
+
     def get_memory_usage(self) -> str:
         """Returns formatted string showing RAM usage with visual bar."""
         memory = self.get_memory_percentage()
@@ -47,12 +113,13 @@ class MemoryMonitor:
         swap = self.get_swap_percentage()
         return self._format_usage_swap(swap)
 
+    def _bar(self, percent):
+        """Look up the precomputed bar string for a usage percentage"""
+        idx = min(self.bars, max(0, int(percent * self._bar_scale)))
+        return self._bar_cache[idx]
+
     def _format_usage(self, memory):
-        memory_percent = memory / 100.0
-        memory_visual = '#' * int(memory_percent * self.bars) + '-' * (self.bars - int(memory_percent * self.bars))
-        return f"Memory: [{memory_visual}] {memory:.2f}%"
+        return f"Memory: [{self._bar(memory)}] {memory:.2f}%"
 
     def _format_usage_swap(self, swap):
-        swap_percent = swap / 100.0
-        swap_visual = '#' * int(swap_percent * self.bars) + '-' * (self.bars - int(swap_percent * self.bars))
-        return f"Swap: [{swap_visual}] {swap:.2f}%"
\ No newline at end of file
+        return f"Swap: [{self._bar(swap)}] {swap:.2f}%"
\ No newline at end of file
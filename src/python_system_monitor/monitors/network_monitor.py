@@ -9,7 +9,35 @@ Tracks network interface bandwidth usage with:
 import psutil
 import time
 import socket
-from collections import deque
+
+class _RunningMean:
+    """Fixed-window moving average with O(1) updates.
+
+    Keeps a ring buffer and a running total, so adding a sample never
+    allocates or re-sums the window. The total is recomputed exactly once
+    per pass over the buffer, so float error cannot build up.
+    """
+    def __init__(self, window):
+        self.window = window
+        self.buffer = [0.0] * window
+        self.total = 0.0
+        self.index = 0
+        self.filled = 0
+
+    def __len__(self):
+        return self.filled
+
+    def append(self, value):
+        self.total += value - self.buffer[self.index]
+        self.buffer[self.index] = value
+        self.index = (self.index + 1) % self.window
+        if self.index == 0:
+            self.total = sum(self.buffer)
+        self.filled = min(self.filled + 1, self.window)
+
+    def mean(self):
+        # Rates are never negative; clamp any residual rounding error
+        return max(0.0, self.total / self.filled) if self.filled else 0
 
 class NetworkMonitor:
     """Monitors network bandwidth with smoothed rate calculations.
@@ -21,11 +49,12 @@ class NetworkMonitor:
     smoothed rate calculations to prevent erratic readings.
     """
     def __init__(self, smoothing_window=3):
-        self.last_received = psutil.net_io_counters().bytes_recv
-        self.last_sent = psutil.net_io_counters().bytes_sent
-        self.last_check_time = time.time()
-        self.recv_rates = deque(maxlen=smoothing_window)
-        self.sent_rates = deque(maxlen=smoothing_window)
+        counters = psutil.net_io_counters()
+        self.last_received = counters.bytes_recv
+        self.last_sent = counters.bytes_sent
+        self.last_check_time = time.monotonic()
+        self.recv_rates = _RunningMean(smoothing_window)
+        self.sent_rates = _RunningMean(smoothing_window)
         self._update_interfaces()
 
     def _update_interfaces(self):
@@ -37,16 +66,13 @@ class NetworkMonitor:
                     break
 
     def get_bandwidth_usage(self):
-        current_time = time.time()
+        current_time = time.monotonic()
         current = psutil.net_io_counters()
         
         # Reduce minimum time delta
         time_delta = current_time - self.last_check_time
         if time_delta < 0.05: 
-            if self.recv_rates and self.sent_rates:
-                recv_rate = self.recv_rates[-1]
-                sent_rate = self.sent_rates[-1]
-            else:
+            if not (self.recv_rates and self.sent_rates):
                 return "▼ 0.0KB/s ▲ 0.0KB/s", self.interfaces
         else:
             # Convert to KB/s
@@ -63,8 +89,8 @@ class NetworkMonitor:
             self.last_check_time = current_time
 
         # Calculate smoothed rates
-        avg_recv = sum(self.recv_rates) / len(self.recv_rates) if self.recv_rates else 0
-        avg_sent = sum(self.sent_rates) / len(self.sent_rates) if self.sent_rates else 0
+        avg_recv = self.recv_rates.mean()
+        avg_sent = self.sent_rates.mean()
 
         # Format with standard arrows
         bandwidth_data = f"▼ {avg_recv:.1f}KB/s ▲ {avg_sent:.1f}KB/s"
@@ -9,6 +9,7 @@ Key features:
 - Memory and CPU utilization measurement
 """
 
+import heapq
 import psutil
 import signal
 import os
@@ -24,69 +25,82 @@ class ProcessMonitor:
     - Network connections
     - Thread counts
     """
-    def __init__(self):
+    # Fields gathered for every process in a single pass by process_iter
+    PROCESS_ATTRS = [
+        'pid', 'name', 'username', 'status', 'memory_percent',
+        'cpu_percent', 'num_threads', 'io_counters'
+    ]
+    # psutil 6 renamed Process.connections() to net_connections()
+    CONNECTIONS_METHOD = (
+        'net_connections' if hasattr(psutil.Process, 'net_connections') else 'connections'
+    )
+
+    def __init__(self, connection_ttl=1.0):
         self.cpu_percent_dict = {}
         self.io_counters = {}
         self.last_io_update = {}
-        self.last_update = time.time()
+        self.connection_cache = {}
+        self.connection_ttl = connection_ttl
+        self.last_update = time.monotonic()
 
     def get_running_processes(self, num_processes=15):
-        current_time = time.time()
+        current_time = time.monotonic()
         processes = []
         
-        for proc in psutil.process_iter(['pid', 'name', 'username', 'status']):
-            try:
-                with proc.oneshot():
-                    # Basic info
-                    info = proc.info
-                    info['memory_percent'] = proc.memory_percent()
-                    
-                    # CPU usage
-                    cpu_percent = proc.cpu_percent()
-                    self.cpu_percent_dict[proc.pid] = cpu_percent
-                    info['cpu_percent'] = cpu_percent
+        for proc in psutil.process_iter(self.PROCESS_ATTRS):
+            info = proc.info
+            pid = info['pid']
+            # Unreadable fields come back as None
+            info['memory_percent'] = info['memory_percent'] or 0.0
+            info['cpu_percent'] = info['cpu_percent'] or 0.0
+            info['num_threads'] = info['num_threads'] or 0
+            self.cpu_percent_dict[pid] = info['cpu_percent']
 
-                    # IO counters
-                    try:
-                        io = proc.io_counters()
-                        if proc.pid in self.io_counters:
-                            last_io = self.io_counters[proc.pid]
-                            last_time = self.last_io_update[proc.pid]
-                            time_delta = current_time - last_time
-                            
-                            info['io_read_speed'] = (io.read_bytes - last_io.read_bytes) / time_delta
-                            info['io_write_speed'] = (io.write_bytes - last_io.write_bytes) / time_delta
-                        else:
-                            info['io_read_speed'] = 0
-                            info['io_write_speed'] = 0
-                        
-                        self.io_counters[proc.pid] = io
-                        self.last_io_update[proc.pid] = current_time
-                    except (psutil.NoSuchProcess, psutil.AccessDenied):
-                        info['io_read_speed'] = 0
-                        info['io_write_speed'] = 0
+            # IO counters
+            io = info.pop('io_counters')
+            time_delta = current_time - self.last_io_update.get(pid, current_time)
+            if io is not None and pid in self.io_counters and time_delta > 0:
+                last_io = self.io_counters[pid]
+                info['io_read_speed'] = (io.read_bytes - last_io.read_bytes) / time_delta
+                info['io_write_speed'] = (io.write_bytes - last_io.write_bytes) / time_delta
+            else:
+                info['io_read_speed'] = 0
+                info['io_write_speed'] = 0
+            if io is not None:
+                self.io_counters[pid] = io
+                self.last_io_update[pid] = current_time
 
-                    # Network connections
-                    try:
-                        info['connections'] = len(proc.connections())
-                    except (psutil.NoSuchProcess, psutil.AccessDenied):
-                        info['connections'] = 0
+            processes.append((info, proc))
 
-                    # Thread count
-                    try:
-                        info['num_threads'] = proc.num_threads()
-                    except (psutil.NoSuchProcess, psutil.AccessDenied):
-                        info['num_threads'] = 0
+        self._purge_stale(info['pid'] for info, _ in processes)
+        self.last_update = current_time
+        top = heapq.nlargest(num_processes, processes,
+                             key=lambda entry: entry[0]['memory_percent'])
 
-                    processes.append(info)
+        # Connection lookups scan every socket, so only do them for the rows shown
+        for info, proc in top:
+            info['connections'] = self._get_connection_count(proc, current_time)
+        return [info for info, _ in top]
 
-            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                continue
+    def _purge_stale(self, live_pids):
+        """Forget tracking state for processes that have exited"""
+        live = set(live_pids)
+        self.cpu_percent_dict = {pid: v for pid, v in self.cpu_percent_dict.items() if pid in live}
+        self.io_counters = {pid: v for pid, v in self.io_counters.items() if pid in live}
+        self.last_io_update = {pid: v for pid, v in self.last_io_update.items() if pid in live}
+        self.connection_cache = {pid: v for pid, v in self.connection_cache.items() if pid in live}
 
-        self.last_update = current_time
-        return sorted(processes, 
-                     key=lambda p: p.get('memory_percent', 0), 
-                     reverse=True)[:num_processes]
+    def _get_connection_count(self, proc, current_time):
+        """Count a process's network connections, cached per pid for connection_ttl seconds"""
+        cached = self.connection_cache.get(proc.pid)
+        if cached and current_time - cached[0] < self.connection_ttl:
+            return cached[1]
+        try:
+            count = len(getattr(proc, self.CONNECTIONS_METHOD)())
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            count = 0
+        self.connection_cache[proc.pid] = (current_time, count)
+        return count
 
     def get_process_details(self, pid):
         """Get detailed information for a specific process"""
@@ -105,7 +119,7 @@ class ProcessMonitor:
                         'cpu_times': proc.cpu_times(),
                         'memory_maps': proc.memory_maps(),
                         'memory_info': proc.memory_info(),
-                        'connections': proc.connections(),
+                        'connections': getattr(proc, self.CONNECTIONS_METHOD)(),
                         'open_files': proc.open_files(),
                         'threads': proc.threads(),
                         'environ': proc.environ()
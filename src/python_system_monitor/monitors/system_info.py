@@ -9,103 +9,160 @@ Key features:
 - Cached data management for static information
 """
 
+import functools
+import os
 import platform
 import psutil
 import socket
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
+import time
+
+# Hardware and kernel details that cannot change while the monitor is running.
+# os.uname() is a single syscall; platform.processor() forks `uname -p` on Linux
+if hasattr(os, 'uname'):
+    _UNAME = os.uname()
+    _OS_NAME = f"{_UNAME.sysname} {_UNAME.release}"
+    _CPU_NAME = _UNAME.machine
+else:
+    _OS_NAME = f"{platform.system()} {platform.release()}"
+    _CPU_NAME = platform.processor()
+_CORE_COUNT = psutil.cpu_count(logical=True)
+
+# The lines shown in the system panel, filled from the collectors' fields;
+# only what fits the panel's minimum height is collected
+_INFO_TEMPLATE = (
+    "OS: {OS}\nHost: {Host}\nIP: {IP}\n"
+    "CPU: {CPU}\nCores: {Cores}\n"
+    "RAM: {RAM}\nAvailable: {Available}"
+)
+
+@functools.lru_cache(maxsize=256)
+def _format_whole_uptime(seconds):
+    days, remainder = divmod(seconds, 86400)
+    hours, remainder = divmod(remainder, 3600)
+    return f"{days}d {hours}h {remainder // 60}m"
+
+class _InfoFields(dict):
+    """Template fields; anything a failed collector did not supply shows N/A"""
+    def __missing__(self, key):
+        return "N/A"
 
 class SystemInfo:
     """Asynchronous system information collector.
 
-    Uses ThreadPoolExecutor for potentially blocking operations and
-    implements caching for relatively static information.
+    Args:
+        host_ttl (float): Seconds the hostname/IP are reused before being
+            looked up again
+        min_interval (float): Calls closer together than this reuse the
+            previous memory reading
+
+    Every reading is a cheap local syscall or /proc read, so nothing is
+    offloaded to threads; relatively static information is cached.
     """
-    def __init__(self):
-        self.executor = ThreadPoolExecutor(max_workers=2)
+    __slots__ = (
+        'host_ttl', 'cached_ip', 'cached_hostname',
+        '_host_checked', 'min_interval', '_readings', '_inflight'
+    )
+
+    def __init__(self, host_ttl=300, min_interval=1.0):
+        self.host_ttl = host_ttl
         self.cached_ip = None
         self.cached_hostname = None
+        self._host_checked = 0
+        self.min_interval = min_interval
+        self._readings = {}
+        self._inflight = None
 
     async def get_system_info(self):
-        """Collect system info without blocking the event loop"""
-        loop = asyncio.get_running_loop()
-        
+        """Collect system info without blocking the event loop.
+
+        Concurrent callers share a single in-flight collection.
+        """
+        if self._inflight is None or self._inflight.done():
+            self._inflight = asyncio.ensure_future(self._collect())
+        # Shielded so one cancelled caller does not cancel the others
+        return await asyncio.shield(self._inflight)
+
+    async def _collect(self):
         try:
             results = await asyncio.gather(
-                self._get_os_info(loop),
+                self._get_os_info(),
                 self._get_cpu_info(),
                 self._get_ram_info(),
-                self._get_disk_info(loop),
-                self._get_battery_status(loop),
                 return_exceptions=True
             )
         except Exception as e:
             return f"System Info Error: {str(e)}"
 
-        info = []
+        fields = _InfoFields()
         for result in results:
             if isinstance(result, dict):
-                info.extend([f"{k}: {v}" for k, v in result.items()])
-            elif not isinstance(result, Exception):
-                info.append(str(result))
-
-        return "\n".join(info[:7])  
-    async def _get_os_info(self, loop):
-        """Async OS/Host info with caching"""
-        if not self.cached_hostname:
-            self.cached_hostname = await loop.run_in_executor(
-                self.executor, socket.gethostname
-            )
-        if not self.cached_ip:
-            self.cached_ip = await loop.run_in_executor(
-                self.executor, socket.gethostbyname, self.cached_hostname
-            )
+                fields.update(result)
+        return _INFO_TEMPLATE.format_map(fields)
+
+    async def _get_os_info(self):
+        """Async OS/Host info; hostname and IP are refreshed every host_ttl seconds"""
+        now = time.monotonic()
+        if (not self.cached_hostname or not self.cached_ip
+                or now - self._host_checked >= self.host_ttl):
+            self._host_checked = now
+            # gethostname is a uname() syscall, cheaper than a thread hop
+            hostname = socket.gethostname()
+            ip = self._get_primary_ip()
+            # A failed lookup keeps the last good value
+            if hostname:
+                self.cached_hostname = hostname
+            if ip != "N/A" or not self.cached_ip:
+                self.cached_ip = ip
         
         return {
-            "OS": f"{platform.system()} {platform.release()}",
+            "OS": _OS_NAME,
             "Host": self.cached_hostname,
             "IP": self.cached_ip
         }
 
+    def _get_primary_ip(self):
+        """First non-loopback IPv4 address of an up interface (no DNS lookup)"""
+        stats = psutil.net_if_stats()
+        addresses = [
+            addr.address
+            for name, addrs in psutil.net_if_addrs().items()
+            if name not in stats or stats[name].isup
+            for addr in addrs
+            if addr.family == socket.AF_INET
+        ]
+        for address in addresses:
+            if not address.startswith('127.'):
+                return address
+        return addresses[0] if addresses else "N/A"
+
+    def _throttled(self, key, fn):
+        """Call fn at most once per min_interval, reusing its last result"""
+        now = time.monotonic()
+        cached = self._readings.get(key)
+        if cached and now - cached[0] < self.min_interval:
+            return cached[1]
+        value = fn()
+        self._readings[key] = (now, value)
+        return value
+
     async def _get_cpu_info(self):
         """Non-blocking CPU info"""
         return {
-            "CPU": f"{platform.processor()}",
-            "Cores": f"{psutil.cpu_count(logical=True)}"
+            "CPU": _CPU_NAME,
+            "Cores": str(_CORE_COUNT)
         }
 
     async def _get_ram_info(self):
         """Memory info using psutil"""
-        mem = psutil.virtual_memory()
+        mem = self._throttled('ram', psutil.virtual_memory)
         return {
             "RAM": f"{mem.total / (1024**3):.1f}GB",
             "Available": f"{mem.available / (1024**3):.1f}GB"
         }
 
-    async def _get_disk_info(self, loop):
-        """Async disk info"""
-        usage = await loop.run_in_executor(
-            self.executor, psutil.disk_usage, '/'
-        )
-        return {
-            "Disk": f"{usage.percent}% ({usage.free / (1024**3):.1f}GB free)"
-        }
-
-    async def _get_battery_status(self, loop):
-        """Safe battery status check"""
-        try:
-            battery = await loop.run_in_executor(
-                self.executor, getattr, psutil, "sensors_battery"
-            )
-            if battery:
-                return {"Battery": f"{battery.percent}%"}
-            return {"Battery": "N/A"}
-        except AttributeError:
-            return {"Battery": "N/A"}
-
-    def _format_uptime(self, seconds):
+    @staticmethod
+    def _format_uptime(seconds):
         """Format uptime duration"""
-        days, remainder = divmod(seconds, 86400)
-        hours, remainder = divmod(remainder, 3600)
-        minutes, _ = divmod(remainder, 60)
-        return f"{int(days)}d {int(hours)}h {int(minutes)}m"
\ No newline at end of file
+        # Cache on whole seconds so float uptimes share entries
+        return _format_whole_uptime(int(seconds))
\ No newline at end of file
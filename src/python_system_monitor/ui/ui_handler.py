@@ -3,12 +3,48 @@ ui_handler.py - Handles UI rendering and layout management
 """
 
 import curses
-import time
+import locale
+import os
+import sys
 import math
-from collections import defaultdict
+from operator import itemgetter
+from collections import deque
+from itertools import islice
+from typing import NamedTuple
 
 import psutil
 
+# Synchronized output (DEC private mode 2026): the terminal holds the frame
+# until the end marker and paints it in one go, avoiding tearing.
+SYNC_BEGIN = '\x1b[?2026h'
+SYNC_END = '\x1b[?2026l'
+SYNC_TERM_PROGRAMS = ('wezterm', 'ghostty', 'iterm.app', 'vscode', 'contour')
+SYNC_TERMS = ('kitty', 'foot', 'alacritty', 'ghostty', 'wezterm', 'contour')
+
+# Process list row: PID, NAME, USER, MEM%, CPU%, STATUS
+PROCESS_ROW_FORMAT = "%-7d%-20.20s%-10.10s%6.1f%6.1f%-8.8s"
+PROCESS_ROW_FIELDS = itemgetter('pid', 'name', 'username', 'memory_percent',
+                                'cpu_percent', 'status')
+PROCESS_HEADER = "PID    NAME                USER      MEM%  CPU%  STATUS  "
+
+class Section(NamedTuple):
+    """Geometry of one boxed section; inner_* exclude the border"""
+    x: int
+    y: int
+    w: int
+    h: int
+    inner_w: int
+    inner_h: int
+
+class Layout(NamedTuple):
+    """Screen layout: one Section per panel, in drawing order"""
+    system: Section
+    cpu: Section
+    processes: Section
+    memory: Section
+    network: Section
+    instructions: Section
+
 class UIHandler:
     def __init__(self, stdscr):
         self.stdscr = stdscr
@@ -16,10 +52,27 @@ class UIHandler:
         self.sort_by = 'memory_percent'
         self.sort_reverse = True
         self.search_term = ''
+        self._search_term_lower = ''  # lowered once per edit, not per process
         self.show_details = False
         self.selected_pid = None
-        self.graph_data = defaultdict(list)
         self.max_history = 60  # 1 minute of history at 1s intervals
+        # One sample per update; the ring buffers drop the oldest automatically
+        self.graph_data = {
+            metric: deque(maxlen=self.max_history)
+            for metric in ('cpu', 'memory', 'load')
+        }
+
+        # Latest draw arguments per section, flushed once per frame
+        self._pending = {}
+        self._dirty = set()
+        self.too_small = False
+        self._needs_flush = False
+        # Called whenever there is something to render, so the renderer can sleep
+        self._wakeup = None
+        # Runs of text currently on screen: {y: {x: (text, attr)}}
+        self._shadow = {}
+        self._blank = ''
+        self.sync_updates = self._supports_sync_updates()
 
         # Add content size tracking BEFORE get_layout is called
         self.content_sizes = {
@@ -38,19 +91,25 @@ class UIHandler:
             'margin': 1
         }
         
+        # Color thresholds for usage indicators
+        self.color_thresholds = {
+            'normal': 60,    # Below this is green
+            'warning': 85,   # Below this is yellow, above is red
+        }
+
         # Initialize color pairs
         curses.use_default_colors()
         self.init_colors()
         self.last_layout = None
+        self._layout_cache = {}
+        # Invariant for the life of the process; sizes the CPU section
+        self._cpu_count = psutil.cpu_count() or 1
         self.buffer = None
 
         # Create a new window for buffering
         self.window = curses.newwin(curses.LINES, curses.COLS)
         self.window.keypad(1)
         self.window.nodelay(1)
-        
-        # Initialize colors
-        self.init_colors()
 
         # Add box drawing characters
         self.box_chars = {
@@ -66,14 +125,10 @@ class UIHandler:
             }
         }
         
-        # Try to detect if unicode is supported
-        try:
-            self.stdscr.addstr(0, 0, '─')
-            self.use_unicode = True
-        except:
-            self.use_unicode = False
-        finally:
-            self.stdscr.clear()
+        self._edge_cache = {}
+
+        # Detect unicode support from the locale rather than probing the screen
+        self.use_unicode = self._locale_supports_unicode()
 
         # Initialize color gradients
         self.GRADIENT_PAIRS = [
@@ -111,11 +166,12 @@ class UIHandler:
         self.last_height, self.last_width = curses.LINES, curses.COLS
         self.last_layout = self.get_layout(self.last_height, self.last_width)
 
-        # Color thresholds for usage indicators
-        self.color_thresholds = {
-            'normal': 60,    # Below this is green
-            'warning': 85,   # Below this is yellow, above is red
-        }
+        # Bar segments for every width up to the screen width, and the
+        # percentage label for every whole percent
+        self._fill_runs = []
+        self._empty_runs = []
+        self._ensure_bar_runs(self.last_width)
+        self._percent_labels = tuple(f"{p:3.0f}%" for p in range(101))
 
         self.process_scroll_offset = 0  # Add scroll offset for processes
         self.show_help = False  # Add help view toggle
@@ -144,8 +200,32 @@ class UIHandler:
             'high': curses.color_pair(4)       # Red
         }
 
+        # Color for every whole percentage, so lookups need no comparisons
+        self._color_lut = tuple(
+            self.usage_colors['low'] if p < self.color_thresholds['normal']
+            else self.usage_colors['medium'] if p < self.color_thresholds['warning']
+            else self.usage_colors['high']
+            for p in range(101)
+        )
+
     def get_layout(self, h, w):
-        """Improved responsive layout with content-aware sizing"""
+        """Improved responsive layout with content-aware sizing.
+
+        Layouts are memoized per terminal size and section minimums, so
+        resizing back to a previous size is just a dict lookup.
+        """
+        key = (h, w, tuple(
+            (size['min_h'], size['min_w']) for size in self.content_sizes.values()
+        ))
+        layout = self._layout_cache.get(key)
+        if layout is None:
+            if len(self._layout_cache) >= 8:
+                self._layout_cache.clear()
+            layout = self._layout_cache[key] = self._compute_layout(h, w)
+        return layout
+
+    def _compute_layout(self, h, w):
+        """Compute section geometry for a terminal of h rows by w columns"""
         margin = self.layout['margin']
         
         # Calculate available space
@@ -177,7 +257,7 @@ class UIHandler:
             self.content_sizes['cpu']['min_h'],
             min(int(available_height * 0.3),
                 # Adjust based on number of CPU cores
-                4 + (psutil.cpu_count() + 1) // 2)  # +1 for overall CPU
+                4 + (self._cpu_count + 1) // 2)  # +1 for overall CPU
         )
         
         # Remaining height for processes
@@ -200,92 +280,104 @@ class UIHandler:
         if remaining_height > 0:
             instructions_height += remaining_height
         
-        layout = {
-            'system': {
-                'x': margin,
-                'y': margin,
-                'w': left_col_width,
-                'h': system_height,
-                'inner_w': left_col_width - 2,  # Account for borders
-                'inner_h': system_height - 2
-            },
-            'cpu': {
-                'x': margin,
-                'y': system_height + (margin * 2),
-                'w': left_col_width,
-                'h': cpu_height,
-                'inner_w': left_col_width - 2,
-                'inner_h': cpu_height - 2
-            },
-            'processes': {
-                'x': margin,
-                'y': system_height + cpu_height + (margin * 3),
-                'w': left_col_width,
-                'h': process_height,
-                'inner_w': left_col_width - 2,
-                'inner_h': process_height - 2
-            },
-            'memory': {
-                'x': left_col_width + (margin * 2),
-                'y': network_height + (margin * 2),
-                'w': right_col_width,
-                'h': memory_height,
-                'inner_w': right_col_width - 2,
-                'inner_h': memory_height - 2
-            },
-            'network': {
-                'x': left_col_width + (margin * 2),
-                'y': margin,
-                'w': right_col_width,
-                'h': network_height,
-                'inner_w': right_col_width - 2,
-                'inner_h': network_height - 2
-            },
-            'instructions': {
-                'x': left_col_width + (margin * 2),
-                'y': network_height + memory_height + (margin * 3),
-                'w': right_col_width,
-                'h': instructions_height,
-                'inner_w': right_col_width - 2,
-                'inner_h': instructions_height - 2
-            }
-        }
+        layout = Layout(
+            system=Section(
+                x=margin,
+                y=margin,
+                w=left_col_width,
+                h=system_height,
+                inner_w=left_col_width - 2,  # Account for borders
+                inner_h=system_height - 2
+            ),
+            cpu=Section(
+                x=margin,
+                y=system_height + (margin * 2),
+                w=left_col_width,
+                h=cpu_height,
+                inner_w=left_col_width - 2,
+                inner_h=cpu_height - 2
+            ),
+            processes=Section(
+                x=margin,
+                y=system_height + cpu_height + (margin * 3),
+                w=left_col_width,
+                h=process_height,
+                inner_w=left_col_width - 2,
+                inner_h=process_height - 2
+            ),
+            memory=Section(
+                x=left_col_width + (margin * 2),
+                y=network_height + (margin * 2),
+                w=right_col_width,
+                h=memory_height,
+                inner_w=right_col_width - 2,
+                inner_h=memory_height - 2
+            ),
+            network=Section(
+                x=left_col_width + (margin * 2),
+                y=margin,
+                w=right_col_width,
+                h=network_height,
+                inner_w=right_col_width - 2,
+                inner_h=network_height - 2
+            ),
+            instructions=Section(
+                x=left_col_width + (margin * 2),
+                y=network_height + memory_height + (margin * 3),
+                w=right_col_width,
+                h=instructions_height,
+                inner_w=right_col_width - 2,
+                inner_h=instructions_height - 2
+            )
+        )
         return layout
 
     def draw_box(self, y, x, h, w, title=''):
         """Draw a box with proper error handling and fallback to ASCII"""
         try:
-            chars = self.box_chars['unicode' if self.use_unicode else 'ascii']
-            
-            # Draw title
-            self.stdscr.attron(curses.color_pair(2))
-            self.stdscr.addstr(y, x + 2, f" {title} ")
-            self.stdscr.attroff(curses.color_pair(2))
+            style = 'unicode' if self.use_unicode else 'ascii'
+            chars = self.box_chars[style]
+            top, bottom = self._box_edges(style, w)
             
-            # Draw corners
-            self.stdscr.addch(y, x, chars['tl'])
-            self.stdscr.addch(y, x + w - 1, chars['tr'])
-            self.stdscr.addch(y + h - 1, x, chars['bl'])
-            self.stdscr.addch(y + h - 1, x + w - 1, chars['br'])
-            
-            # Draw horizontal lines
-            for i in range(x + 1, x + w - 1):
-                self.stdscr.addch(y, i, chars['h'])
-                self.stdscr.addch(y + h - 1, i, chars['h'])
+            # Draw top edge, then the title over it
+            self.stdscr.addstr(y, x, top)
+            if title:
+                self.stdscr.addstr(y, x + 2, f" {title} ", curses.color_pair(2))
             
             # Draw vertical lines
             for i in range(y + 1, y + h - 1):
-                self.stdscr.addch(i, x, chars['v'])
-                self.stdscr.addch(i, x + w - 1, chars['v'])
+                self.stdscr.addstr(i, x, chars['v'])
+                self.stdscr.addstr(i, x + w - 1, chars['v'])
+            
+            # Bottom edge last: writing the screen's last cell raises
+            self.stdscr.addstr(y + h - 1, x, bottom)
                 
+        except UnicodeEncodeError:
+            # Terminal encoding can't represent the box characters
+            if self.use_unicode:
+                self.use_unicode = False
+                self.draw_box(y, x, h, w, title)
         except curses.error:
             # Silently handle curses errors
             pass
 
+    def _box_edges(self, style, w):
+        """Top and bottom border strings for a box of width w, built once per size"""
+        key = (style, w)
+        edges = self._edge_cache.get(key)
+        if edges is None:
+            chars = self.box_chars[style]
+            edges = (
+                chars['tl'] + chars['h'] * (w - 2) + chars['tr'],
+                chars['bl'] + chars['h'] * (w - 2) + chars['br']
+            )
+            self._edge_cache[key] = edges
+        return edges
+
     def draw_size_warning(self, h, w):
         """Draw terminal size warning"""
         msg = f"Terminal too small. Min size: {self.layout['min_width']}x{self.layout['min_height']}"
-        self.stdscr.clear()
+        self.clear_screen()
         self.stdscr.addstr(h//2, (w-len(msg))//2, msg)
 
     def update_process_section(self, y, x, width, processes, selected_idx):
@@ -294,71 +386,67 @@ class UIHandler:
             return
 
         # Filter processes based on search
-        if self.search_term:
-            processes = [p for p in processes if self.search_term.lower() in p['name'].lower()]
+        term = self._search_term_lower
+        if term:
+            processes = [p for p in processes if term in p['name'].lower()]
 
         # Sort processes
-        processes.sort(key=lambda p: p[self.sort_by], reverse=self.sort_reverse)
+        processes.sort(key=itemgetter(self.sort_by), reverse=self.sort_reverse)
 
         # Bound selection and scroll offset
         max_idx = len(processes) - 1
         self.selected_process = min(max_idx, self.selected_process)
-        visible_height = self.last_layout['processes']['inner_h'] - 1  # -1 for header
+        visible_height = self.last_layout.processes.inner_h - 1  # -1 for header
         max_scroll = max(0, len(processes) - visible_height)
         self.process_scroll_offset = min(max_scroll, self.process_scroll_offset)
 
         # Draw header
-        headers = [
-            ('PID', 7), ('NAME', 20), ('USER', 10), 
-            ('MEM%', 6), ('CPU%', 6), ('STATUS', 8)
-        ]
-        header_str = ''
-        for name, size in headers:
-            header_str += f'{name:<{size}}'
-        self.stdscr.attron(curses.A_BOLD)
-        self.stdscr.addstr(y, x, header_str)
-        self.stdscr.attroff(curses.A_BOLD)
+        self._put(y, x, PROCESS_HEADER, curses.A_BOLD)
 
         # Draw scrollbar if needed
         if len(processes) > visible_height:
             scrollbar_height = visible_height
             scroll_pos = int((self.process_scroll_offset / max_scroll) * (scrollbar_height - 1))
-            for i in range(scrollbar_height):
-                char = '█' if i == scroll_pos else '│'
-                try:
-                    self.stdscr.addstr(y + 1 + i, x + width - 1, char)
-                except curses.error:
-                    pass
+            # Whole track in one call, then the thumb. Both bypass _put's
+            # shadow since the track overwrites the previous thumb.
+            try:
+                self.stdscr.vline(y + 1, x + width - 1, curses.ACS_VLINE, scrollbar_height)
+                self.stdscr.addstr(y + 1 + scroll_pos, x + width - 1, '█')
+            except curses.error:
+                pass
 
         # Draw visible processes
         visible_processes = processes[self.process_scroll_offset:self.process_scroll_offset + visible_height]
+        row_format = PROCESS_ROW_FORMAT
+        row_fields = PROCESS_ROW_FIELDS
         for idx, proc in enumerate(visible_processes):
-            if y + idx + 1 >= curses.LINES - 1:
+            if y + idx + 1 >= self.last_height - 1:
                 break
 
             # Highlight selected process
             is_selected = idx + self.process_scroll_offset == self.selected_process
-            if is_selected:
-                self.stdscr.attron(curses.A_REVERSE)
+            attr = curses.A_REVERSE if is_selected else 0
 
             # Format and draw process line
-            line = (f"{proc['pid']:<7}{proc['name']:<20}{proc['username']:<10}"
-                   f"{proc['memory_percent']:>6.1f}{proc['cpu_percent']:>6.1f}"
-                   f"{proc['status']:<8}")
-            self.stdscr.addstr(y + idx + 1, x, line[:width-1])  # -1 for scrollbar
+            line = row_format % row_fields(proc)
+            self._put(y + idx + 1, x, self._fit(line, width - 1), attr)  # -1 for scrollbar
 
-            if is_selected:
-                self.stdscr.attroff(curses.A_REVERSE)
+        # Blank out rows left over from a longer list
+        blank = self._blank_line(width - 1)
+        for idx in range(len(visible_processes), visible_height):
+            if y + idx + 1 >= self.last_height - 1:
+                break
+            self._put(y + idx + 1, x, blank)
 
         # Draw scroll indicators if needed
         if self.process_scroll_offset > 0:
-            self.stdscr.addstr(y, x + width - 3, "↑")
+            self._put(y, x + width - 3, "↑")
         if self.process_scroll_offset + visible_height < len(processes):
-            self.stdscr.addstr(y + visible_height, x + width - 3, "↓")
+            self._put(y + visible_height, x + width - 3, "↓")
 
         # Draw search bar if active
         if self.search_term:
-            self.stdscr.addstr(y-1, x, f"Search: {self.search_term}")
+            self._put(y-1, x, f"Search: {self.search_term}")
 
     def handle_input(self, key):
         """Handle keyboard input with scrolling"""
@@ -373,7 +461,7 @@ class UIHandler:
                     self.process_scroll_offset = self.selected_process
         elif key == curses.KEY_DOWN:
             self.selected_process += 1
-            visible_height = self.last_layout['processes']['inner_h']
+            visible_height = self.last_layout.processes.inner_h
             if self.selected_process >= self.process_scroll_offset + visible_height:
                 self.process_scroll_offset += 1
         elif key == ord('g'):  # Go to top
@@ -383,9 +471,10 @@ class UIHandler:
             self.selected_process = 99999  # Will be bounded by actual process count
             self.process_scroll_offset = max(0, self.selected_process - visible_height + 1)
         elif key == ord('/'):
-            self.search_term = ''
+            self.search_term = self._search_term_lower = ''
             curses.echo()
             self.search_term = self.stdscr.getstr(0, 0).decode('utf-8')
+            self._search_term_lower = self.search_term.lower()
             curses.noecho()
         elif key == ord('s'):
             sort_options = ['memory_percent', 'cpu_percent', 'pid', 'name']
@@ -398,32 +487,30 @@ class UIHandler:
         
     def update_graphs(self, cpu_percent, memory_percent, load_avg):
         """Update historical data for graphs"""
-        timestamp = time.time()
-        self.graph_data['cpu'].append((timestamp, cpu_percent))
-        self.graph_data['memory'].append((timestamp, memory_percent))
-        self.graph_data['load'].append((timestamp, load_avg[0]))
-
-        # Keep only last minute of data
-        cutoff = timestamp - 60
-        for metric in self.graph_data:
-            self.graph_data[metric] = [(t, v) for t, v in self.graph_data[metric] 
-                                     if t > cutoff]
+        self.graph_data['cpu'].append(cpu_percent)
+        self.graph_data['memory'].append(memory_percent)
+        self.graph_data['load'].append(load_avg[0])
 
     def draw_graph(self, y, x, width, height, data, title):
         """Draw a simple ASCII graph"""
         if not data:
             return
 
-        max_val = max(v for _, v in data)
-        min_val = min(v for _, v in data)
-        range_val = max(max_val - min_val, 1)
+        max_val = max(data)
+        min_val = min(data)
+        scale = (height - 1) / max(max_val - min_val, 1)
 
-        for i, (_, val) in enumerate(data):
-            if i >= width:
-                break
-            bar_height = int((val - min_val) / range_val * (height - 1))
-            for h in range(bar_height):
-                self.stdscr.addch(y + height - h - 1, x + i, '|')
+        heights = [int((val - min_val) * scale) for val in islice(data, width)]
+        for i, bar_height in enumerate(heights):
+            # One vertical run per column, growing up from the baseline
+            if bar_height > 0:
+                self.stdscr.vline(y + height - bar_height, x + i, '|', bar_height)
+
+    def _ensure_bar_runs(self, width):
+        """Extend the precomputed fill/empty runs to cover bars up to width"""
+        for i in range(len(self._fill_runs), width + 1):
+            self._fill_runs.append(self.styles['bars']['fill'] * i)
+            self._empty_runs.append(self.styles['bars']['empty'] * i)
 
     def draw_modern_bar(self, y, x, width, percentage, label="", color_pair=None):
         """Draw a modern-looking progress bar with boundary checking"""
@@ -442,33 +529,33 @@ class UIHandler:
             
             # Draw label if we have space
             if label and label_width < width:
-                self.stdscr.addstr(y, x, f"{label}: ")
+                self._put(y, x, f"{label}: ")
                 x += label_width
             
             # Calculate bar width
-            filled_width = int(available_width * (percentage / 100))
+            filled_width = min(available_width, max(0, int(available_width * (percentage / 100))))
             empty_width = available_width - filled_width
+            if available_width >= len(self._fill_runs):
+                self._ensure_bar_runs(available_width)
             
             # Draw bar with color
-            if color_pair:
-                self.stdscr.attron(color_pair)
+            bar_attr = color_pair or 0
             
             # Draw filled portion
             if filled_width > 0:
-                self.stdscr.addstr(y, x, self.styles['bars']['fill'] * filled_width)
+                self._put(y, x, self._fill_runs[filled_width], bar_attr)
             
             # Draw empty portion
             if empty_width > 0:
-                self.stdscr.addstr(y, x + filled_width, 
-                                 self.styles['bars']['empty'] * empty_width)
-            
-            if color_pair:
-                self.stdscr.attroff(color_pair)
+                self._put(y, x + filled_width, 
+                          self._empty_runs[empty_width], bar_attr)
             
             # Draw percentage if we have space
             if width >= label_width + available_width + percent_width:
-                self.stdscr.addstr(y, x + available_width + 1, 
-                                 f"{percentage:3.0f}%")
+                rounded = round(percentage)
+                percent_label = (self._percent_labels[rounded] if 0 <= rounded <= 100
+                                 else f"{percentage:3.0f}%")
+                self._put(y, x + available_width + 1, percent_label)
                 
         except curses.error:
             pass
@@ -476,26 +563,22 @@ class UIHandler:
     def update_cpu_section(self, y, x, width, stats):
         """Modernized CPU display with proper layout management"""
         try:
-            section = self.last_layout['cpu']
-            inner_width = section['inner_w']
-            inner_height = section['inner_h']
+            section = self.last_layout.cpu
+            inner_width = section.inner_w
+            inner_height = section.inner_h
             
             # Track content size
             content_height = 3 + (len(stats['cores']) + 1) // 2  # Basic height + cores
             content_width = max(35, width)  # Minimum width for core display
             self.update_section_content_size('cpu', content_height, content_width)
             
-            # Use inner dimensions for drawing
-            self.draw_modern_bar(y, x, inner_width, stats['usage'], "CPU",
-                               self._get_usage_color(stats['usage']))
-            
             # Get section height from current layout or fallback
-            section_height = (self.last_layout['cpu']['h'] if self.last_layout 
+            section_height = (self.last_layout.cpu.h if self.last_layout 
                             else self.last_height // 3) - 2  # Account for borders
             
-            # Overall CPU usage with color gradient
+            # Overall CPU usage with color gradient, using inner dimensions
             color = self._get_usage_color(stats['usage'])
-            self.draw_modern_bar(y, x, width, stats['usage'], "CPU", color)
+            self.draw_modern_bar(y, x, inner_width, stats['usage'], "CPU", color)
             
             # Calculate core display layout
             cores = stats['cores']
@@ -530,7 +613,7 @@ class UIHandler:
                 # CPU frequency
                 if stats.get('freq_current'):
                     freq_line = f"Freq: {stats['freq_current']:4.1f} MHz"
-                    self.stdscr.addstr(info_y, x, freq_line[:width])
+                    self._put(info_y, x, self._fit(freq_line, width))
 
                 # Load average
                 if stats.get('load_avg'):
@@ -539,7 +622,7 @@ class UIHandler:
                         load_line = (f"Load: {stats['load_avg'][0]:.2f} "
                                    f"{stats['load_avg'][1]:.2f} "
                                    f"{stats['load_avg'][2]:.2f}")
-                        self.stdscr.addstr(load_y, x, load_line[:width])
+                        self._put(load_y, x, self._fit(load_line, width))
                     
         except curses.error:
             pass
@@ -547,8 +630,8 @@ class UIHandler:
     def update_memory_section(self, y, x, width, mem_percent, swap_percent):
         """Update memory section with usage bars"""
         try:
-            section = self.last_layout['memory']
-            inner_width = section['inner_w']
+            section = self.last_layout.memory
+            inner_width = section.inner_w
             
             # Track content size
             content_height = 4  # Two bars plus padding
@@ -568,9 +651,9 @@ class UIHandler:
         try:
             lines = info.split('\n')
             for idx, line in enumerate(lines):
-                if y + idx >= curses.LINES - 1:
+                if y + idx >= self.last_height - 1:
                     break
-                self.stdscr.addstr(y + idx, x, line[:width])
+                self._put(y + idx, x, self._fit(line, width))
         except curses.error:
             pass
 
@@ -580,11 +663,15 @@ class UIHandler:
             bandwidth_data, interfaces = data
             
             # Show current bandwidth
-            self.stdscr.addstr(y, x, f"Bandwidth(KB/s): {bandwidth_data}")
+            self._put(y, x, self._fit(f"Bandwidth(KB/s): {bandwidth_data}", width))
             
             # Show only first interface (or most important one)
-            primary_interface = next(iter(interfaces.items()))
-            self.stdscr.addstr(y + 1, x, f"{primary_interface[0]}: {primary_interface[1]}")
+            if interfaces:
+                name, address = next(iter(interfaces.items()))
+                line = f"{name}: {address}"
+            else:
+                line = "No IPv4 interfaces"
+            self._put(y + 1, x, self._fit(line, width))
             
         except curses.error:
             pass
@@ -593,42 +680,196 @@ class UIHandler:
         """Scale dimensions based on available space"""
         return max(min_size, int(base_size * (available_space / 100)))
 
+    def _terminal_size(self):
+        """Current terminal size, read from the tty rather than curses' cached view.
+
+        ncurses only applies a pending SIGWINCH inside getch/doupdate, and
+        neither runs while the screen is idle or too small to draw, so the
+        real size is read directly and pushed into curses with resizeterm.
+        """
+        try:
+            size = os.get_terminal_size()
+        except (OSError, ValueError):
+            curses.update_lines_cols()
+            return self.stdscr.getmaxyx()
+        new_h, new_w = size.lines, size.columns
+        if (new_h, new_w) != self.stdscr.getmaxyx():
+            curses.resizeterm(new_h, new_w)
+        return new_h, new_w
+
     def handle_resize(self):
         """Improved resize handling with layout updates"""
-        curses.update_lines_cols()
-        new_h, new_w = self.stdscr.getmaxyx()
-        
+        new_h, new_w = self._terminal_size()
+
         # Only recalculate if dimensions actually changed
         if new_h != self.last_height or new_w != self.last_width:
-            self.stdscr.clear()
+            # A full clear (not erase): the terminal may have reflowed its
+            # contents, so curses' idea of the physical screen is stale
+            self.clear_screen()
             self.last_height, self.last_width = new_h, new_w
+            self._ensure_bar_runs(new_w)
             
-            # Recreate buffer with new dimensions
-            if self.buffer:
-                del self.buffer
-            self.buffer = curses.newpad(new_h, new_w)
+            # Resize the buffer in place rather than reallocating it
+            if self.buffer is None:
+                self.buffer = curses.newpad(new_h, new_w)
+            else:
+                self.buffer.resize(new_h, new_w)
             
             # Calculate and store new layout
             self.last_layout = self.get_layout(new_h, new_w)
             return self.last_layout
         return None
 
+    def _put(self, y, x, text, attr=0):
+        """addstr that skips runs already on screen unchanged.
+
+        curses diffs cells again in doupdate; this just avoids re-issuing
+        writes for text that has not changed since the last frame.
+        """
+        row = self._shadow.get(y)
+        if row is None:
+            row = self._shadow[y] = {}
+        entry = (text, attr)
+        if row.get(x) == entry:
+            return
+        # Anything this write overlaps is no longer on screen as cached
+        end = x + len(text)
+        for other_x in [ox for ox, (otext, _) in row.items()
+                        if ox < end and ox + len(otext) > x]:
+            del row[other_x]
+        self.stdscr.addstr(y, x, text, attr)
+        row[x] = entry
+
+    def _blank_line(self, width):
+        """A run of spaces width long, sliced from one shared blank string"""
+        if width > len(self._blank):
+            self._blank = ' ' * width
+        return self._blank[:width]
+
+    def _fit(self, text, width):
+        """Truncate or pad text to exactly width, overwriting stale characters"""
+        if len(text) >= width:
+            return text[:width]
+        return text + self._blank_line(width - len(text))
+
+    def clear_screen(self):
+        """Clear the screen and forget what was drawn on it"""
+        self.stdscr.clear()
+        self._shadow.clear()
+
+    def post_update(self, section, *data):
+        """Queue the latest data for a section until the next frame.
+
+        Samples identical to what is already queued or on screen are
+        ignored, so a quiet machine causes no redraws.
+        """
+        if self._pending.get(section) == data:
+            return
+        self._pending[section] = data
+        self._dirty.add(section)
+        self._wake()
+
+    def mark_dirty(self, section):
+        """Redraw a section on the next frame using its last posted data"""
+        if section in self._pending:
+            self._dirty.add(section)
+            self._wake()
+
+    def mark_all_dirty(self):
+        """Redraw every section that has data, e.g. after the layout changed"""
+        self._dirty.update(self._pending)
+        self._wake()
+
+    def draw_section(self, section, *data):
+        """Draw a section's data inside its box in the current layout"""
+        dims = getattr(self.last_layout, section)
+        y, x, width = dims.y + 1, dims.x + 1, dims.w - 2
+        if section == 'cpu':
+            self.update_cpu_section(y, x, width, *data)
+        elif section == 'memory':
+            self.update_memory_section(y, x, width, *data)
+        elif section == 'network':
+            self.update_network_section(y, x, width, *data)
+        elif section == 'system':
+            self.update_system_info(y, x, width, *data)
+        elif section == 'processes':
+            self.update_process_section(y, x, width, *data, self.selected_process)
+
+    def request_flush(self):
+        """Flush the screen on the next frame even if no section changed"""
+        self._needs_flush = True
+        self._wake()
+
+    def set_wakeup(self, callback):
+        """Register a callback run whenever a frame has work to do, or None"""
+        self._wakeup = callback
+        if callback and (self._dirty or self._needs_flush):
+            callback()
+
+    def _wake(self):
+        if self._wakeup:
+            self._wakeup()
+
+    def render_frame(self):
+        """Draw all dirty sections and flush them to the terminal in one update.
+
+        This is the only place the screen is pushed to the terminal; everything
+        else draws into the curses buffer and waits for the next frame.
+        """
+        drew = False
+        if self._dirty and not self.too_small:
+            for section in self._dirty:
+                try:
+                    self.draw_section(section, *self._pending[section])
+                except Exception:
+                    # One section's bad data must not stop the others drawing
+                    pass
+            self._dirty.clear()
+            drew = True
+        if not (drew or self._needs_flush):
+            return False
+        self._needs_flush = False
+        self.refresh()
+        return True
+
+    def _locale_supports_unicode(self):
+        """Check whether the terminal's encoding (per locale/env) is UTF-8"""
+        encoding = (locale.getpreferredencoding(False) or '').upper().replace('-', '')
+        lang = (os.environ.get('LC_ALL') or os.environ.get('LC_CTYPE')
+                or os.environ.get('LANG', '')).upper().replace('-', '')
+        return 'UTF8' in encoding or 'UTF8' in lang
+
+    def _supports_sync_updates(self):
+        """Detect terminals that implement synchronized output"""
+        term_program = os.environ.get('TERM_PROGRAM', '').lower()
+        term = os.environ.get('TERM', '').lower()
+        return (term_program in SYNC_TERM_PROGRAMS
+                or any(name in term for name in SYNC_TERMS))
+
+    def _write_escape(self, sequence):
+        """Write a raw escape sequence straight to the terminal"""
+        sys.stdout.write(sequence)
+        sys.stdout.flush()
+
     def refresh(self):
         """Explicit refresh of the screen"""
         try:
             self.stdscr.noutrefresh()
-            curses.doupdate()
+            if self.sync_updates:
+                self._write_escape(SYNC_BEGIN)
+                try:
+                    curses.doupdate()
+                finally:
+                    self._write_escape(SYNC_END)
+            else:
+                curses.doupdate()
         except curses.error:
             pass
 
     def _get_usage_color(self, percentage):
         """Get appropriate color based on usage percentage"""
         try:
-            if percentage < self.color_thresholds['normal']:
-                return self.usage_colors['low']
-            elif percentage < self.color_thresholds['warning']:
-                return self.usage_colors['medium']
-            return self.usage_colors['high']
+            return self._color_lut[min(100, max(0, int(percentage)))]
         except (TypeError, ValueError):
             return self.usage_colors['low']  # Default to green on error
 
@@ -647,16 +888,14 @@ class UIHandler:
     def draw_instructions(self):
         """Draw instructions panel"""
         try:
-            section = self.last_layout['instructions']
-            start_y = section['y'] + 1
-            start_x = section['x'] + 1
+            section = self.last_layout.instructions
+            start_y = section.y + 1
+            start_x = section.x + 1
             
+            title_attr = curses.A_BOLD | curses.color_pair(2)
             for idx, line in enumerate(self.instructions):
-                if idx == 0:
-                    self.stdscr.attron(curses.A_BOLD | curses.color_pair(2))
-                self.stdscr.addstr(start_y + idx, start_x, line)
-                if idx == 0:
-                    self.stdscr.attroff(curses.A_BOLD | curses.color_pair(2))
-                    
+                self.stdscr.addstr(start_y + idx, start_x, line,
+                                   title_attr if idx == 0 else curses.A_NORMAL)
+
         except curses.error:
             pass
\ No newline at end of file
@@ -2,24 +2,24 @@ import pytest
 from python_system_monitor.monitors.cpu_monitor import CPUMonitor
 
 def test_cpu_monitor_init():
-    monitor = CPUMonitor()
-    assert monitor.bars == 50
-    assert hasattr(monitor, 'last_cpu_percent')
+    with CPUMonitor() as monitor:
+        assert monitor.bars == 50
+        assert hasattr(monitor, 'last_cpu_percent')
 
 def test_get_detailed_stats(mock_psutil):
-    monitor = CPUMonitor()
-    stats = monitor.get_detailed_stats()
-    assert 'usage' in stats
-    assert 'freq_current' in stats
-    assert 'cores' in stats
-    assert stats['usage'] == 50.0
+    with CPUMonitor(stat_path=None) as monitor:
+        stats = monitor.get_detailed_stats()
+        assert 'usage' in stats
+        assert 'freq_current' in stats
+        assert 'cores' in stats
+        assert stats['usage'] == 50.0
 
 def test_format_usage():
-    monitor = CPUMonitor(bars=10)
-    formatted = monitor._format_usage(50.0)
-    assert len(formatted) > 0
-    assert '[#####-----]' in formatted
-    assert '50.00%' in formatted
+    with CPUMonitor(bars=10) as monitor:
+        formatted = monitor._format_usage(50.0)
+        assert len(formatted) > 0
+        assert '[#####-----]' in formatted
+        assert '50.00%' in formatted
 
 @pytest.mark.parametrize("cpu_value,expected_hashes", [
     (0, 0),
@@ -27,6 +27,67 @@ def test_format_usage():
     (100, 10),
 ])
 def test_format_usage_values(cpu_value, expected_hashes):
-    monitor = CPUMonitor(bars=10)
-    formatted = monitor._format_usage(cpu_value)
-    assert formatted.count('#') == expected_hashes
+    with CPUMonitor(bars=10) as monitor:
+        formatted = monitor._format_usage(cpu_value)
+        assert formatted.count('#') == expected_hashes
+
+def test_format_usage_clamps_out_of_range():
+    with CPUMonitor(bars=10) as monitor:
+        assert '[##########]' in monitor._format_usage(105.0)
+        assert '[----------]' in monitor._format_usage(-1.0)
+
+def test_slow_readings_are_cached(monkeypatch):
+    calls = {'freq': 0, 'load': 0}
+    def fake_freq():
+        calls['freq'] += 1
+        return None
+    def fake_load():
+        calls['load'] += 1
+        return (1.0, 1.0, 1.0)
+    monkeypatch.setattr('psutil.cpu_freq', fake_freq)
+    monkeypatch.setattr('psutil.getloadavg', fake_load)
+    with CPUMonitor() as monitor:
+        monitor.get_detailed_stats()
+        stats = monitor.get_detailed_stats()
+        assert calls == {'freq': 1, 'load': 1}
+        assert stats['load_avg'] == (1.0, 1.0, 1.0)
+
+def test_get_cpu_cores_usage_matches_single_core_format():
+    with CPUMonitor(bars=10) as monitor:
+        monitor.last_per_cpu_percent = [0.0, 29.0, 50.0, 100.0]
+        assert monitor.get_cpu_cores_usage() == [
+            monitor._format_core_usage(idx, core)
+            for idx, core in enumerate(monitor.last_per_cpu_percent)
+        ]
+
+def test_usage_from_proc_stat(tmp_path):
+    stat = tmp_path / "stat"
+    stat.write_text(
+        "cpu  100 0 100 800 0 0 0 0 0 0\n"
+        "cpu0 50 0 50 400 0 0 0 0 0 0\n"
+        "cpu1 50 0 50 400 0 0 0 0 0 0\n"
+        "intr 12345\n"
+    )
+    with CPUMonitor(stat_path=str(stat)) as monitor:
+        assert monitor.last_cpu_percent == 20.0
+        assert monitor.last_per_cpu_percent == [20.0, 20.0]
+
+        stat.write_text(
+            "cpu  250 0 150 900 0 0 0 0 0 0\n"
+            "cpu0 150 0 100 400 0 0 0 0 0 0\n"
+            "cpu1 100 0 50 500 0 0 0 0 0 0\n"
+        )
+        monitor._sample_usage()
+        assert monitor.last_cpu_percent == 66.7
+        assert monitor.last_per_cpu_percent == [100.0, 33.3]
+
+def test_missing_stat_file_falls_back_to_psutil(mock_psutil):
+    with CPUMonitor(stat_path="/nonexistent/stat") as monitor:
+        assert monitor.last_cpu_percent == 50.0
+
+def test_malformed_stat_falls_back_to_psutil(tmp_path, mock_psutil):
+    stat = tmp_path / "stat"
+    stat.write_text("cpu  100 0 100\n")
+    with CPUMonitor(stat_path=str(stat)) as monitor:
+        assert monitor.last_cpu_percent == 50.0
+        assert monitor._stat_file is None
@@ -2,22 +2,22 @@ import pytest
 from python_system_monitor.monitors.memory_monitor import MemoryMonitor
 
 def test_memory_monitor_init():
-    monitor = MemoryMonitor()
-    assert monitor.bars == 50
+    with MemoryMonitor() as monitor:
+        assert monitor.bars == 50
 
 def test_get_memory_percentage(mock_psutil):
-    monitor = MemoryMonitor()
-    assert monitor.get_memory_percentage() == 75.0
+    with MemoryMonitor() as monitor:
+        assert monitor.get_memory_percentage() == 75.0
 
 def test_get_swap_percentage(mock_psutil):
-    monitor = MemoryMonitor()
-    assert monitor.get_swap_percentage() == 25.0
+    with MemoryMonitor() as monitor:
+        assert monitor.get_swap_percentage() == 25.0
 
 def test_format_usage():
-    monitor = MemoryMonitor(bars=10)
-    formatted = monitor._format_usage(50.0)
-    assert '[#####-----]' in formatted
-    assert '50.00%' in formatted
+    with MemoryMonitor(bars=10) as monitor:
+        formatted = monitor._format_usage(50.0)
+        assert '[#####-----]' in formatted
+        assert '50.00%' in formatted
 
 @pytest.mark.parametrize("memory_value,expected_hashes", [
     (0, 0),
@@ -25,6 +25,57 @@ def test_format_usage():
     (100, 10),
 ])
 def test_format_usage_values(memory_value, expected_hashes):
-    monitor = MemoryMonitor(bars=10)
-    formatted = monitor._format_usage(memory_value)
-    assert formatted.count('#') == expected_hashes
+    with MemoryMonitor(bars=10) as monitor:
+        formatted = monitor._format_usage(memory_value)
+        assert formatted.count('#') == expected_hashes
+
+def test_format_usage_swap():
+    with MemoryMonitor(bars=10) as monitor:
+        formatted = monitor._format_usage_swap(30.0)
+        assert '[###-------]' in formatted
+        assert formatted.startswith('Swap:')
+
+def test_get_both(mock_psutil):
+    with MemoryMonitor(meminfo_path=None) as monitor:
+        assert monitor.get_both() == (75.0, 25.0)
+
+def test_get_both_is_cached_within_ttl(monkeypatch):
+    calls = []
+    def fake_virtual_memory():
+        calls.append(1)
+        return type('vm', (), {'percent': 10.0})()
+    monkeypatch.setattr('psutil.virtual_memory', fake_virtual_memory)
+    monkeypatch.setattr('psutil.swap_memory', lambda: type('sm', (), {'percent': 0.0})())
+    with MemoryMonitor(cache_ttl=60, meminfo_path=None) as monitor:
+        monitor.get_both()
+        monitor.get_both()
+        assert len(calls) == 1
+
+
+def test_get_both_from_proc_meminfo(tmp_path):
+    meminfo = tmp_path / "meminfo"
+    meminfo.write_text(
+        "MemTotal:       16000000 kB\n"
+        "MemFree:         1000000 kB\n"
+        "MemAvailable:    4000000 kB\n"
+        "SwapTotal:       2000000 kB\n"
+        "SwapFree:        1500000 kB\n"
+        "HugePages_Total:       0\n"
+    )
+    with MemoryMonitor(cache_ttl=0, meminfo_path=str(meminfo)) as monitor:
+        assert monitor.get_both() == (75.0, 25.0)
+        # The open file is re-read from the start on every sample
+        meminfo.write_text(meminfo.read_text().replace("SwapFree:        1500000", "SwapFree:        2000000"))
+        assert monitor.get_both() == (75.0, 0.0)
+
+def test_get_both_falls_back_to_psutil(mock_psutil):
+    with MemoryMonitor(meminfo_path="/nonexistent/meminfo") as monitor:
+        assert monitor.get_both() == (75.0, 25.0)
+        assert monitor._meminfo_file is None
+
+def test_close_releases_meminfo_and_falls_back(mock_psutil):
+    monitor = MemoryMonitor()
+    handle = monitor._meminfo_file
+    monitor.close()
+    assert handle is None or handle.closed
+    assert monitor.get_both() == (75.0, 25.0)
@@ -0,0 +1,35 @@
+import pytest
+import random
+from python_system_monitor.monitors.network_monitor import NetworkMonitor, _RunningMean
+
+def test_network_monitor_init():
+    monitor = NetworkMonitor(smoothing_window=3)
+    assert monitor.recv_rates.window == 3
+    assert len(monitor.recv_rates) == 0
+
+def test_running_mean_window():
+    mean = _RunningMean(3)
+    assert mean.mean() == 0
+    for value in (1.0, 2.0, 3.0):
+        mean.append(value)
+    assert mean.mean() == pytest.approx(2.0)
+    mean.append(10.0)  # evicts 1.0
+    assert mean.mean() == pytest.approx(5.0)
+    assert len(mean) == 3
+
+def test_get_bandwidth_usage_format():
+    monitor = NetworkMonitor()
+    bandwidth, interfaces = monitor.get_bandwidth_usage()
+    assert bandwidth.startswith("▼ ")
+    assert "KB/s ▲ " in bandwidth
+    assert isinstance(interfaces, dict)
+
+def test_running_mean_returns_to_zero_after_traffic():
+    mean = _RunningMean(3)
+    rng = random.Random(0)
+    for _ in range(100000):
+        mean.append(rng.uniform(0, 10000))
+    for _ in range(3):
+        mean.append(0.0)
+    assert 0.0 <= mean.mean() < 1e-6
+    assert f"{mean.mean():.1f}" == "0.0"
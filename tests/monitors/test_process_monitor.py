@@ -0,0 +1,49 @@
+from python_system_monitor.monitors.process_monitor import ProcessMonitor
+
+def test_process_monitor_init():
+    monitor = ProcessMonitor()
+    assert monitor.io_counters == {}
+    assert monitor.connection_cache == {}
+
+def test_get_running_processes_limit_and_fields():
+    monitor = ProcessMonitor()
+    processes = monitor.get_running_processes(num_processes=5)
+    assert 0 < len(processes) <= 5
+    for proc in processes:
+        for key in ('pid', 'name', 'memory_percent', 'cpu_percent',
+                    'io_read_speed', 'io_write_speed', 'connections', 'num_threads'):
+            assert key in proc
+    memory = [p['memory_percent'] for p in processes]
+    assert memory == sorted(memory, reverse=True)
+
+def test_connections_only_fetched_for_shown_processes():
+    monitor = ProcessMonitor()
+    processes = monitor.get_running_processes(num_processes=3)
+    assert set(monitor.connection_cache) == {p['pid'] for p in processes}
+
+def test_kill_process_rejects_invalid_pid():
+    monitor = ProcessMonitor()
+    assert monitor.kill_process(-1) is False
+    assert monitor.kill_process('1') is False
+
+def test_stale_pids_are_purged():
+    monitor = ProcessMonitor()
+    stale_pid = 2 ** 22 + 12345  # above the default pid_max
+    monitor.io_counters[stale_pid] = object()
+    monitor.last_io_update[stale_pid] = 0.0
+    monitor.cpu_percent_dict[stale_pid] = 0.0
+    monitor.connection_cache[stale_pid] = (0.0, 0)
+    monitor.get_running_processes()
+    assert stale_pid not in monitor.io_counters
+    assert stale_pid not in monitor.last_io_update
+    assert stale_pid not in monitor.cpu_percent_dict
+    assert stale_pid not in monitor.connection_cache
+
+def test_connection_count_without_legacy_connections_method():
+    class NewPsutilProcess:
+        pid = 4242
+        def net_connections(self):
+            return [object(), object()]
+    monitor = ProcessMonitor()
+    monitor.CONNECTIONS_METHOD = 'net_connections'
+    assert monitor._get_connection_count(NewPsutilProcess(), 0.0) == 2
@@ -1,11 +1,12 @@
 import pytest
 import asyncio
+import socket
+from collections import namedtuple
 from python_system_monitor.monitors.system_info import SystemInfo
 
 @pytest.mark.asyncio
 async def test_system_info_init():
     info = SystemInfo()
-    assert info.executor is not None
     assert info.cached_ip is None
     assert info.cached_hostname is None
 
@@ -20,7 +21,7 @@ async def test_get_system_info():
 @pytest.mark.asyncio
 async def test_get_os_info(mock_psutil):
     info = SystemInfo()
-    result = await info._get_os_info(asyncio.get_event_loop())
+    result = await info._get_os_info()
     assert isinstance(result, dict)
     assert "OS" in result
     assert "Host" in result
@@ -33,3 +34,106 @@ async def test_format_uptime():
     assert "1d" in uptime
     assert "1h" in uptime
     assert "1m" in uptime
+
+snicaddr = namedtuple('snicaddr', 'family address')
+snicstats = namedtuple('snicstats', 'isup')
+
+@pytest.fixture
+def interfaces(monkeypatch):
+    """Interface name -> IPv4 address, served through psutil as up interfaces"""
+    mapping = {}
+    monkeypatch.setattr('psutil.net_if_addrs', lambda: {
+        name: [snicaddr(socket.AF_INET, address)] for name, address in mapping.items()
+    })
+    monkeypatch.setattr('psutil.net_if_stats', lambda: {
+        name: snicstats(True) for name in mapping
+    })
+    return mapping
+
+@pytest.mark.asyncio
+async def test_ip_from_interfaces(interfaces):
+    interfaces.update({'lo': '127.0.0.1', 'eth0': '192.168.1.20'})
+    info = SystemInfo()
+    result = await info._get_os_info()
+    assert result["IP"] == "192.168.1.20"
+
+def test_primary_ip_without_interfaces(interfaces):
+    assert SystemInfo()._get_primary_ip() == "N/A"
+    interfaces['lo'] = '127.0.0.1'
+    assert SystemInfo()._get_primary_ip() == "127.0.0.1"
+
+@pytest.mark.asyncio
+async def test_host_info_refreshed_after_ttl(interfaces):
+    interfaces['eth0'] = '192.168.1.20'
+    info = SystemInfo(host_ttl=300)
+    await info._get_os_info()
+    interfaces['eth0'] = '192.168.1.30'
+    assert (await info._get_os_info())["IP"] == "192.168.1.20"
+    info._host_checked -= 300
+    assert (await info._get_os_info())["IP"] == "192.168.1.30"
+    # Losing the address keeps the last good one
+    interfaces.clear()
+    info._host_checked -= 300
+    assert (await info._get_os_info())["IP"] == "192.168.1.30"
+
+svmem = namedtuple('svmem', 'total available')
+
+@pytest.mark.asyncio
+async def test_readings_throttled_within_min_interval(monkeypatch):
+    calls = []
+    monkeypatch.setattr('psutil.virtual_memory',
+                        lambda: calls.append(1) or svmem(len(calls) * 1024**3, 1024**3))
+    info = SystemInfo(min_interval=60)
+    first = await info._get_ram_info()
+    second = await info._get_ram_info()
+    assert len(calls) == 1
+    assert first == second
+    info._readings['ram'] = (info._readings['ram'][0] - 60, info._readings['ram'][1])
+    await info._get_ram_info()
+    assert len(calls) == 2
+
+def test_format_uptime_accepts_float_seconds():
+    assert SystemInfo._format_uptime(90061.9) == "1d 1h 1m"
+
+def test_primary_ip_skips_down_interfaces(monkeypatch):
+    monkeypatch.setattr('psutil.net_if_addrs', lambda: {
+        'lo': [snicaddr(socket.AF_INET, '127.0.0.1')],
+        'eth0': [snicaddr(socket.AF_INET, '10.0.0.5')],
+        'wlan0': [snicaddr(socket.AF_INET, '192.168.1.7')],
+    })
+    monkeypatch.setattr('psutil.net_if_stats', lambda: {
+        'lo': snicstats(True), 'eth0': snicstats(False), 'wlan0': snicstats(True),
+    })
+    assert SystemInfo()._get_primary_ip() == '192.168.1.7'
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_collection(monkeypatch):
+    calls = []
+    async def fake_cpu_info(self):
+        calls.append(1)
+        await asyncio.sleep(0)
+        return {"CPU": "test"}
+    monkeypatch.setattr(SystemInfo, '_get_cpu_info', fake_cpu_info)
+    info = SystemInfo()
+    results = await asyncio.gather(*(info.get_system_info() for _ in range(3)))
+    assert len(set(results)) == 1
+    assert "CPU: test" in results[0]
+    assert len(calls) == 1
+
+@pytest.mark.asyncio
+async def test_failed_collector_fields_show_na(monkeypatch):
+    async def broken(self):
+        raise RuntimeError("no memory info")
+    monkeypatch.setattr(SystemInfo, '_get_ram_info', broken)
+    result = await SystemInfo().get_system_info()
+    lines = result.split("\n")
+    assert len(lines) == 7
+    assert "RAM: N/A" in lines
+    assert lines[0].startswith("OS: ")
+
+def test_format_uptime_caches_whole_seconds():
+    from python_system_monitor.monitors.system_info import _format_whole_uptime
+    _format_whole_uptime.cache_clear()
+    SystemInfo._format_uptime(100.1)
+    SystemInfo._format_uptime(100.7)
+    assert _format_whole_uptime.cache_info().currsize == 1
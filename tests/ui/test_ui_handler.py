@@ -0,0 +1,230 @@
+import os
+import pytest
+from collections import deque
+from unittest.mock import MagicMock
+from python_system_monitor.ui.ui_handler import UIHandler
+
+@pytest.fixture
+def ui(mock_curses, monkeypatch):
+    monkeypatch.setattr('python_system_monitor.ui.ui_handler.curses', mock_curses)
+    # No real tty: size comes from stdscr.getmaxyx unless a test overrides this
+    def no_terminal():
+        raise OSError("not a terminal")
+    monkeypatch.setattr(os, 'get_terminal_size', no_terminal)
+    handler = UIHandler(MagicMock())
+    handler.stdscr.reset_mock()
+    return handler
+
+def test_put_skips_unchanged_text(ui):
+    ui._put(1, 1, "hello")
+    ui._put(1, 1, "hello")
+    assert ui.stdscr.addstr.call_count == 1
+
+def test_put_redraws_on_attr_change(ui):
+    ui._put(1, 1, "hello")
+    ui._put(1, 1, "hello", 2)
+    assert ui.stdscr.addstr.call_count == 2
+
+def test_put_redraws_after_overlapping_write(ui):
+    ui._put(1, 5, "-----")
+    ui._put(1, 0, "##########")  # covers the dashes
+    ui._put(1, 5, "-----")
+    assert ui.stdscr.addstr.call_count == 3
+
+def test_clear_screen_forgets_shadow(ui):
+    ui._put(1, 1, "hello")
+    ui.clear_screen()
+    ui._put(1, 1, "hello")
+    assert ui.stdscr.addstr.call_count == 2
+
+def test_render_frame_draws_only_dirty_sections(ui):
+    ui.post_update('memory', 40.0, 10.0)
+    assert ui.render_frame() is True
+    assert ui.render_frame() is False
+
+def test_draw_box_writes_whole_edges(ui):
+    ui.use_unicode = False
+    ui.draw_box(0, 0, 4, 6, 'CPU')
+    written = [call.args[2] for call in ui.stdscr.addstr.call_args_list]
+    assert written[0] == '+----+'
+    assert written[1] == ' CPU '
+    assert written[-1] == '+----+'
+    assert len(written) == 2 + 2 * 2 + 1
+
+def test_graph_history_is_bounded(ui):
+    for i in range(ui.max_history + 5):
+        ui.update_graphs(i, i, (1.0, 1.0, 1.0))
+    assert len(ui.graph_data['cpu']) == ui.max_history
+    assert ui.graph_data['cpu'][0] == 5
+
+@pytest.mark.parametrize("percentage,level", [
+    (0, 'low'), (59.9, 'low'), (60, 'medium'), (84.9, 'medium'),
+    (85, 'high'), (150, 'high'), (-5, 'low'), (None, 'low'),
+])
+def test_get_usage_color(ui, percentage, level):
+    assert ui._get_usage_color(percentage) == ui.usage_colors[level]
+
+def test_get_layout_is_memoized(ui):
+    assert ui.get_layout(40, 120) is ui.get_layout(40, 120)
+    ui.update_section_content_size('cpu', 20, 60)
+    assert ui.get_layout(40, 120).cpu.h >= 22
+
+def test_draw_modern_bar_segments(ui):
+    ui.draw_modern_bar(0, 0, 27, 50.0, "RAM")
+    written = [call.args[2] for call in ui.stdscr.addstr.call_args_list]
+    assert written == ["RAM: ", "█" * 7, "░" * 8, " 50%"]
+
+def test_draw_modern_bar_wider_than_screen(ui):
+    width = ui.last_width + 50
+    ui.draw_modern_bar(0, 0, width, 100.0)
+    written = [call.args[2] for call in ui.stdscr.addstr.call_args_list]
+    assert written[0] == "█" * (width - 7)
+    assert written[-1] == "100%"
+
+@pytest.mark.parametrize("percentage", [0.4, 49.5, 50.5, 99.6, 100.0])
+def test_percent_labels_match_format(ui, percentage):
+    assert ui._percent_labels[round(percentage)] == f"{percentage:3.0f}%"
+
+def test_process_rows_are_fixed_width(ui):
+    processes = [
+        {'pid': 1, 'name': 'a' * 40, 'username': None, 'memory_percent': 12.345,
+         'cpu_percent': 1.0, 'status': 'sleeping'},
+    ]
+    ui.update_process_section(1, 1, 80, processes, 0)
+    rows = [call.args[2] for call in ui.stdscr.addstr.call_args_list
+            if call.args[0] == 2]
+    assert [row.rstrip() for row in rows] == ["1      " + "a" * 20 + "None        12.3   1.0sleeping"]
+    assert len(rows[0]) == 79
+
+
+def test_process_section_blanks_leftover_rows(ui):
+    ui.last_height = 20
+    processes = [
+        {'pid': 1, 'name': 'a', 'username': 'root', 'memory_percent': 1.0,
+         'cpu_percent': 1.0, 'status': 'running'},
+    ]
+    ui.update_process_section(1, 1, 40, processes, 0)
+    cleared = [call.args for call in ui.stdscr.addstr.call_args_list
+               if call.args[0] == 3]
+    assert cleared == [(3, 1, " " * 39, 0)]
+
+def test_draw_graph_one_call_per_column(ui):
+    ui.draw_graph(0, 0, 2, 5, deque([0, 50, 100]), "CPU")
+    calls = [call.args for call in ui.stdscr.vline.call_args_list]
+    # Only the first `width` samples are drawn; the minimum has no bar
+    assert calls == [(3, 1, '|', 2)]
+
+def test_unchanged_sample_does_not_redraw(ui):
+    ui.post_update('memory', 40.0, 10.0)
+    ui.render_frame()
+    ui.post_update('memory', 40.0, 10.0)
+    assert ui.render_frame() is False
+    ui.post_update('memory', 41.0, 10.0)
+    assert ui.render_frame() is True
+
+def test_draw_box_falls_back_to_ascii(ui):
+    def addstr(y, x, text, *args):
+        if '╭' in text:
+            raise UnicodeEncodeError('ascii', text, 0, 1, 'unsupported')
+    ui.use_unicode = True
+    ui.stdscr.addstr.side_effect = addstr
+    ui.draw_box(0, 0, 3, 5)
+    assert ui.use_unicode is False
+    assert ui.stdscr.addstr.call_args_list[-1].args[2] == '+---+'
+
+def test_cpu_bar_drawn_once(ui, monkeypatch):
+    bars = []
+    monkeypatch.setattr(ui, 'draw_modern_bar', lambda *args: bars.append(args[4]))
+    ui.update_cpu_section(1, 1, 60, {'usage': 10.0, 'cores': [5.0, 7.0]})
+    assert bars == ["CPU", "C0", "C1"]
+
+def test_handle_resize_reuses_buffer(ui, mock_curses):
+    ui.stdscr.getmaxyx.return_value = (30, 100)
+    assert ui.handle_resize() is not None
+    buffer = ui.buffer
+    ui.stdscr.getmaxyx.return_value = (35, 110)
+    ui.handle_resize()
+    assert ui.buffer is buffer
+    buffer.resize.assert_called_once_with(35, 110)
+    assert mock_curses.newpad.call_count == 1
+
+def test_scrollbar_drawn_as_track_and_thumb(ui, mock_curses):
+    processes = [
+        {'pid': pid, 'name': 'p', 'username': 'u', 'memory_percent': 1.0,
+         'cpu_percent': 0.0, 'status': 's'}
+        for pid in range(1, 200)
+    ]
+    ui.update_process_section(1, 1, 80, processes, 0)
+    visible = ui.last_layout.processes.inner_h - 1
+    ui.stdscr.vline.assert_called_once_with(2, 80, mock_curses.ACS_VLINE, visible)
+    assert [c.args for c in ui.stdscr.addstr.call_args_list].count((2, 80, '█')) == 1
+
+
+def test_search_filter_is_case_insensitive(ui):
+    ui.stdscr.getstr.return_value = b'PyTh'
+    ui.handle_input(ord('/'))
+    processes = [
+        {'pid': 1, 'name': 'python3', 'username': 'root', 'memory_percent': 1.0,
+         'cpu_percent': 0.0, 'status': 'running'},
+        {'pid': 2, 'name': 'bash', 'username': 'root', 'memory_percent': 2.0,
+         'cpu_percent': 0.0, 'status': 'running'},
+    ]
+    ui.update_process_section(1, 1, 80, processes, 0)
+    drawn = ''.join(call.args[2] for call in ui.stdscr.addstr.call_args_list)
+    assert 'python3' in drawn
+    assert 'bash' not in drawn
+
+
+def test_instructions_title_drawn_with_attr(ui, mock_curses):
+    ui.last_layout = ui.get_layout(40, 120)
+    ui.draw_instructions()
+    first = ui.stdscr.addstr.call_args_list[0].args
+    assert first[2] == ui.instructions[0]
+    assert first[3] == mock_curses.A_BOLD | mock_curses.color_pair(2)
+    ui.stdscr.attron.assert_not_called()
+
+
+def test_wakeup_called_only_for_new_work(ui):
+    wakeup = MagicMock()
+    ui.set_wakeup(wakeup)
+    ui.post_update('cpu', {'usage': 1.0})
+    ui.post_update('cpu', {'usage': 1.0})
+    assert wakeup.call_count == 1
+    ui.request_flush()
+    assert wakeup.call_count == 2
+
+
+def test_network_section_without_interfaces(ui):
+    ui.update_network_section(1, 1, 40, ('x', {}))
+    drawn = [call.args[2] for call in ui.stdscr.addstr.call_args_list]
+    assert drawn[-1].rstrip() == "No IPv4 interfaces"
+
+
+def test_bad_section_data_does_not_stop_frame(ui):
+    ui.last_layout = ui.get_layout(40, 120)
+    ui.post_update('processes', [
+        {'pid': 1, 'name': None, 'username': 'root', 'memory_percent': 1.0,
+         'cpu_percent': 0.0, 'status': 'running'},
+        {'pid': 2, 'name': 'bash', 'username': 'root', 'memory_percent': 2.0,
+         'cpu_percent': 0.0, 'status': 'running'},
+    ])
+    ui.sort_by = 'name'
+    ui.post_update('network', ('x', {'eth0': '10.0.0.1'}))
+    assert ui.render_frame()
+    drawn = ''.join(call.args[2] for call in ui.stdscr.addstr.call_args_list)
+    assert 'eth0: 10.0.0.1' in drawn
+
+
+
+def test_recovers_from_too_small_without_input(ui, mock_curses, monkeypatch):
+    from python_system_monitor.main import apply_layout
+    ui.stdscr.getmaxyx.return_value = (20, 60)
+    ui.handle_resize()
+    apply_layout(ui, ui.stdscr)
+    assert ui.too_small
+    # The terminal grows, but with no getch/doupdate curses still reports 20x60
+    monkeypatch.setattr(os, 'get_terminal_size', lambda: os.terminal_size((120, 40)))
+    assert ui.handle_resize()
+    mock_curses.resizeterm.assert_called_with(40, 120)
+    apply_layout(ui, ui.stdscr)
+    assert not ui.too_small